@@ -1,16 +1,27 @@
 # app.py
 
+import os
+# Persist compiled Numba kernels across restarts; must be set before numba is imported
+os.environ.setdefault("NUMBA_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".numba_cache"))
 import streamlit as st
-import yfinance as yf
+import yfinance_cache as yfc
 import pandas as pd
-import matplotlib.pyplot as plt
-from statsmodels.tsa.seasonal import seasonal_decompose
+from matplotlib.figure import Figure
+import plotly.graph_objects as go
 from statsmodels.tsa.statespace.sarimax import SARIMAX
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
+from io import BytesIO
+import numba
 import numpy as np
 import warnings
 warnings.filterwarnings('ignore')
 
+# Persist the yfinance-cache price store on a mounted volume when configured
+if os.environ.get("YFC_CACHE_DIR"):
+    yfc.yfc_cache_manager.SetCacheDirpath(os.environ["YFC_CACHE_DIR"])
+
 # Streamlit page config
 st.set_page_config(
     page_title="Stock Market Decomposition Dashboard", 
@@ -19,7 +30,7 @@ st.set_page_config(
 )
 
 # Custom CSS for styling with light/dark theme support
-st.markdown("""
+_CSS_BASE = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -96,82 +107,289 @@ st.markdown("""
         background-color: white;
         color: black;
     }
+    
+    /* Theme palette, filled in by the selected theme's variables */
+    .stApp {
+        background-color: var(--app-bg);
+        color: var(--app-fg);
+    }
+    
+    .stPlotlyChart, .stImage {
+        background-color: var(--chart-bg);
+    }
 </style>
-""", unsafe_allow_html=True)
+"""
 
 # --- Theme Configuration ---
-def apply_theme(theme):
-    """Apply light or dark theme to the app"""
-    if theme == "Dark":
-        st.markdown(
-            """
+# Themes only swap CSS variables read by the base stylesheet; figures are
+# rendered theme-neutral, so no Python-side work depends on the selection
+_CSS_THEMES = {
+    "Dark": """
             <style>
                 .stApp {
-                    background-color: #0e1117;
-                    color: white;
-                }
-                .stPlotlyChart, .stPyplot {
-                    background-color: #1e1e1e;
-                }
-                .css-1d391kg, .css-12oz5g7 {
-                    background-color: #0e1117;
+                    --app-bg: #0e1117;
+                    --app-fg: white;
+                    --chart-bg: #1e1e1e;
                 }
             </style>
             """,
-            unsafe_allow_html=True
-        )
-    else:
-        st.markdown(
-            """
+    "Light": """
             <style>
                 .stApp {
-                    background-color: white;
-                    color: black;
+                    --app-bg: white;
+                    --app-fg: black;
+                    --chart-bg: transparent;
                 }
             </style>
-            """,
-            unsafe_allow_html=True
-        )
+            """
+}
+
+def apply_theme(theme):
+    """
+    Apply light or dark theme to the app with a single stylesheet injection.
+    The stylesheet is composed once per session and rebuilt only when the theme
+    changes; it is still emitted every run, as Streamlit drops elements a rerun skips.
+    """
+    if st.session_state.get('_last_theme') != theme:
+        st.session_state['_theme_css'] = _CSS_BASE + _CSS_THEMES[theme]
+        st.session_state['_last_theme'] = theme
+    st.markdown(st.session_state['_theme_css'], unsafe_allow_html=True)
+
+# --- Data Loading ---
+# Default start of the date range; also the range prefetched at startup
+DEFAULT_START_DATE = date(2020, 1, 1)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_prices(ticker: str, start: date, end: date) -> pd.DataFrame:
+    """
+    Load daily prices, memoized per (ticker, start, end) in RAM for the session.
+    yfinance-cache keeps a second tier on disk, so only new bars hit Yahoo Finance.
+    Fetch failures raise, and st.cache_data never caches an exception, so a
+    transient network or rate-limit error is retried on the next rerun.
+    """
+    data = yfc.download(ticker, start=start, end=end, adjust_divs=True, threads=False, progress=False)
+    if data is None:
+        return pd.DataFrame()
+    return data.rename_axis("Date")
+
+@st.cache_data(show_spinner=False)
+def clean_close(data_key: tuple, close_bytes: bytes) -> tuple:
+    """
+    Drop missing closes from the raw float64 bytes of the Close column.
+    Returns the kept values and their row positions for re-attaching dates.
+    """
+    arr = np.frombuffer(close_bytes, dtype=np.float64)
+    keep = np.flatnonzero(np.isfinite(arr))
+    return arr[keep], keep
+
+# --- Decomposition Function ---
+DecomposeResult = namedtuple('DecomposeResult', ['observed', 'trend', 'seasonal', 'resid'])
+
+# Explicit signatures: compiled (or loaded from the on-disk cache) at import,
+# so the first decomposition request doesn't pay for lazy JIT compilation
+@numba.njit('f8[:](f8[:], i8)', cache=True, fastmath=True)
+def rolling_mean(x, w):
+    """
+    Trailing w-point mean in one pass (add the new value, drop the oldest).
+    out[i] averages x[i - w + 1] .. x[i]; the first w - 1 entries are NaN.
+    """
+    n = x.size
+    out = np.full(n, np.nan)
+    if n < w:
+        return out
+    s = 0.0
+    for i in range(w):
+        s += x[i]
+    out[w - 1] = s / w
+    for i in range(w, n):
+        s += x[i] - x[i - w]
+        out[i] = s / w
+    return out
+
+@numba.njit('Tuple((f8[:], f8[:], f8[:]))(f8[:], i8)', cache=True, fastmath=True)
+def decompose_mult(x, period):
+    """
+    Multiplicative decomposition matching statsmodels' seasonal_decompose:
+    centered moving-average trend, per-phase seasonal means normalized to 1,
+    and residual = x / (trend * seasonal). Edges without a full window are NaN.
+    """
+    n = x.size
+    half = period // 2
+    trend = np.full(n, np.nan)
+    seasonal = np.empty(n)
+    resid = np.full(n, np.nan)
+
+    # Centered MA from the trailing mean; even periods average two adjacent
+    # windows, which is the 2 x period filter with half-weight ends
+    trailing = rolling_mean(x, period)
+    for t in range(half, n - half):
+        if period % 2 == 0:
+            trend[t] = 0.5 * (trailing[t + half - 1] + trailing[t + half])
+        else:
+            trend[t] = trailing[t + half]
+
+    # Average the detrended series per seasonal phase, then normalize to mean 1
+    phase_sum = np.zeros(period)
+    phase_count = np.zeros(period)
+    for t in range(half, n - half):
+        phase_sum[t % period] += x[t] / trend[t]
+        phase_count[t % period] += 1.0
+    phase_mean = phase_sum / phase_count
+    phase_mean /= phase_mean.mean()
+
+    for t in range(n):
+        seasonal[t] = phase_mean[t % period]
+    for t in range(half, n - half):
+        resid[t] = x[t] / (trend[t] * seasonal[t])
+    return trend, seasonal, resid
+
+@st.cache_data(show_spinner=False)
+def _decompose_cached(series_bytes, period):
+    """Run decompose_mult on the raw float64 bytes of a series"""
+    # Copy out of the read-only buffer to match the compiled f8[:] signature
+    return decompose_mult(np.frombuffer(series_bytes, dtype=np.float64).copy(), period)
+
+def decompose_series(series, period=30):
+    """Multiplicative decomposition of a price series into a DecomposeResult"""
+    values = np.ascontiguousarray(series, dtype=np.float64)
+    trend, seasonal, resid = _decompose_cached(values.tobytes(), period)
+    return DecomposeResult(
+        observed=pd.Series(values, index=series.index),
+        trend=pd.Series(trend, index=series.index),
+        seasonal=pd.Series(seasonal, index=series.index),
+        resid=pd.Series(resid, index=series.index)
+    )
 
 # --- SARIMA Model Function ---
-def fit_sarima_model(series, forecast_days=30):
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _fit_sarima_cached(series_bytes, n, forecast_days):
+    """
+    Fit SARIMA on the raw float64 bytes of a series and forecast ahead.
+    The fitted model is kept as a shared resource, so reruns on unchanged
+    data skip maximum-likelihood estimation entirely.
+    """
+    series = pd.Series(np.frombuffer(series_bytes, dtype=np.float64, count=n))
+
+    # Auto-detect seasonal period (weekly pattern for stocks)
+    seasonal_period = 5  # 5 trading days in a week
+
+    # Try different SARIMA configurations
+    # Simple configuration that works for most stock data
+    sarima_spec = dict(order=(1, 1, 1),           # (p,d,q) - non-seasonal
+                       seasonal_order=(1, 1, 1, seasonal_period),  # (P,D,Q,s) - seasonal
+                       enforce_stationarity=False,
+                       enforce_invertibility=False)
+
+    # Estimate on the pre-differenced series: the smaller state space makes
+    # each Kalman filter pass cheaper, and a warm start with capped L-BFGS
+    # iterations is plenty for a 30-day dashboard forecast
+    diffed = np.diff(series.values)
+    diffed = diffed[seasonal_period:] - diffed[:-seasonal_period]
+    sigma2_start = float(diffed.var()) or 1.0
+    model = SARIMAX(series, simple_differencing=True, **sarima_spec)
+    params = model.fit(disp=False, method='lbfgs', maxiter=50,
+                       start_params=[0.1, -0.1, 0.1, -0.1, sigma2_start]).params
+
+    # A single filter pass with the estimated parameters on the undifferenced
+    # model gives forecasts and intervals on the price scale
+    fitted_model = SARIMAX(series, **sarima_spec).filter(params)
+    
+    # Generate forecasts
+    forecast = fitted_model.get_forecast(steps=forecast_days)
+    return forecast.predicted_mean, forecast.conf_int(), fitted_model
+
+@st.cache_resource
+def _sarima_executor():
+    """Worker pool shared across sessions for background SARIMA fits"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="sarima")
+
+def submit_sarima_fit(series, forecast_days=30):
+    """Start fitting SARIMA on a worker thread; returns a Future for fit_sarima_model"""
+    values = np.ascontiguousarray(series, dtype=np.float64)
+    return _sarima_executor().submit(_fit_sarima_cached, values.tobytes(), values.size, forecast_days)
+
+def fit_sarima_model(series, forecast_days=30, pending=None):
     """
     Fit SARIMA model to time series data
     SARIMA(p,d,q)(P,D,Q,s) parameters:
     p: AR order, d: differencing, q: MA order
     P: Seasonal AR, D: Seasonal differencing, Q: Seasonal MA, s: Seasonal period
+    Pass the Future from submit_sarima_fit as `pending` to collect a fit already in flight.
     """
     try:
-        # Auto-detect seasonal period (weekly pattern for stocks)
-        seasonal_period = 5  # 5 trading days in a week
-        
-        # Try different SARIMA configurations
-        # Simple configuration that works for most stock data
-        model = SARIMAX(series, 
-                       order=(1, 1, 1),           # (p,d,q) - non-seasonal
-                       seasonal_order=(1, 1, 1, seasonal_period),  # (P,D,Q,s) - seasonal
-                       enforce_stationarity=False,
-                       enforce_invertibility=False)
-        
-        fitted_model = model.fit(disp=False)
-        
-        # Generate forecasts
-        forecast = fitted_model.get_forecast(steps=forecast_days)
-        forecast_values = forecast.predicted_mean
-        confidence_intervals = forecast.conf_int()
-        
-        return forecast_values, confidence_intervals, fitted_model
+        if pending is None:
+            pending = submit_sarima_fit(series, forecast_days)
+        forecast_values, confidence_intervals, fitted_model = pending.result()
+        # Hand back plain arrays, like the fallback, so callers never align indexes
+        return (np.asarray(forecast_values, dtype=np.float32),
+                np.asarray(confidence_intervals, dtype=np.float32),
+                fitted_model)
         
     except Exception as e:
         st.warning(f"SARIMA model failed with error: {e}. Using fallback method.")
         # Fallback: simple moving average projection
-        last_values = series[-10:].mean()  # 10-day average
-        forecast_values = pd.Series([last_values] * forecast_days)
-        confidence_intervals = pd.DataFrame({
-            'lower': forecast_values * 0.95,
-            'upper': forecast_values * 1.05
-        }, index=forecast_values.index)
-        return forecast_values, confidence_intervals, None
+        last_values = rolling_mean(np.ascontiguousarray(series, dtype=np.float64), 10)[-1]  # 10-day average
+        # Forecast and +/-5% band share one buffer; return column views into it
+        fallback = np.empty((forecast_days, 3), dtype=np.float32)
+        fallback[:, 0] = last_values
+        fallback[:, 1] = last_values * 0.95
+        fallback[:, 2] = last_values * 1.05
+        return fallback[:, 0], fallback[:, 1:3], None
+
+# --- Plotting Functions ---
+# Panels are ~1200 px wide at 96 dpi; more points than 2x that are never visible
+MAX_PLOT_POINTS = 2000
+# Figures are drawn once on a transparent background with mid-grey text and
+# axes, which reads on both themes; the page CSS supplies the panel color
+NEUTRAL_FG = '#808080'
+
+@st.cache_data(show_spinner=False)
+def render_decomp_png(series_bytes, dates_bytes):
+    """
+    Render the four-panel decomposition figure to PNG bytes.
+    Uses the object-oriented Figure API (Agg canvas, no pyplot registry),
+    so cache hits skip matplotlib entirely and nothing lingers between reruns.
+    """
+    dates = pd.to_datetime(np.frombuffer(dates_bytes, dtype=np.int64))
+    series = pd.Series(np.frombuffer(series_bytes, dtype=np.float64), index=dates)
+    result = decompose_series(series, period=30)
+
+    # Decompose at full resolution, but stride long series down before drawing
+    if len(series) > MAX_PLOT_POINTS:
+        idx = np.linspace(0, len(series) - 1, MAX_PLOT_POINTS).astype(np.int64)
+        result = DecomposeResult(*(component.iloc[idx] for component in result))
+
+    fig = Figure(figsize=(12, 10), facecolor='none')
+    axes = fig.subplots(4, 1)
+
+    # Custom colors for each subplot
+    colors = ['#1f77b4', '#2ca02c', '#d62728', '#ff7f0e']
+    panels = [
+        (result.observed, 'Observed (Original Data)'),
+        (result.trend, 'Trend'),
+        (result.seasonal, 'Seasonality'),
+        (result.resid, 'Residuals')
+    ]
+
+    for ax, (component, title), color in zip(axes, panels, colors):
+        ax.plot(component.index, component.values, color=color, linewidth=2)
+        ax.set_title(title, color=NEUTRAL_FG)
+        ax.grid(True, alpha=0.3)
+        ax.set_facecolor('none')
+        ax.tick_params(colors=NEUTRAL_FG)
+        for spine in ax.spines.values():
+            spine.set_edgecolor(NEUTRAL_FG)
+
+    # Fixed margins instead of tight_layout(), which measures every artist per render
+    fig.subplots_adjust(left=0.08, right=0.98, top=0.96, bottom=0.06, hspace=0.35)
+    buf = BytesIO()
+    try:
+        fig.savefig(buf, format='png', dpi=96)
+    finally:
+        # Break the Figure/Axes/Line2D reference cycles so the line data is freed
+        # right away rather than whenever the cyclic garbage collector runs
+        fig.clear()
+    return buf.getvalue()
 
 # --- Header Section ---
 st.markdown('<div class="main-header"> Stock Market Analysis & Decomposition Dashboard</div>', unsafe_allow_html=True)
@@ -237,27 +455,51 @@ with col1:
 
 with col2:
     # --- Date Range ---
-    start_date = st.date_input(":green[**📅 Start Date**]", date(2020, 1, 1))
+    start_date = st.date_input(":green[**📅 Start Date**]", DEFAULT_START_DATE)
     end_date = st.date_input(":green[**📅 End Date**]", date.today())
 
 # --- Fetch Data ---
 st.markdown('<div class="section-header">📥 Data Overview</div>', unsafe_allow_html=True)
 
 with st.spinner(f'Fetching data for **{company_name}**...'):
-    data = yf.download(ticker, start=start_date, end=end_date)
+    try:
+        data = load_prices(ticker, start_date, end_date)
+    except Exception:
+        # Invalid range, unknown ticker, network or rate-limit error: show the no-data message
+        data = pd.DataFrame()
 
 if data.empty:
     st.error("❌ No data found! Try a different date range.")
 else:
     # Reset index to make Date a column for easier access
     data_reset = data.reset_index()
-    
+
+    # Pull the columns behind the metric cards into flat arrays once
+    close_np = data['Close'].to_numpy(dtype=np.float64).ravel()
+    vol_np = data['Volume'].to_numpy(dtype=np.float64).ravel() if 'Volume' in data.columns else None
+
+    # --- Make sure 'Close' is a clean Series ---
+    close_vals, close_pos = clean_close((ticker, start_date, end_date), close_np.tobytes())
+    close_series = pd.Series(close_vals, index=data.index[close_pos])
+
+    # ✅ Ensure all values are positive for multiplicative model
+    # Single min-reduction over a float32 view: ample precision for decomposition
+    vals = close_series.to_numpy(dtype=np.float32, copy=False)
+    if vals.size > 0:
+        mn = vals.min()
+        if mn <= 0.0:
+            vals = vals - mn + np.float32(1.0)
+        close_series = pd.Series(vals, index=close_series.index)
+
+    # Start the SARIMA fit now so it runs while the cards and decomposition render
+    sarima_pending = submit_sarima_fit(close_series, forecast_days=30) if len(data_reset) >= 30 else None
+
     # Display key metrics in cards - FIXED: Extract scalar values for formatting
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         # FIX: Extract scalar value for proper formatting
-        current_price_val = float(data_reset['Close'].iloc[-1]) if len(data_reset) > 0 else 0
+        current_price_val = float(close_np[-1]) if close_np.size > 0 else 0
         st.markdown(f"""
         <div class="metric-card">
             <div style="font-size: 0.9rem; opacity: 0.9;">Current Price</div>
@@ -267,9 +509,9 @@ else:
     
     with col2:
         # FIX: Extract scalar values for proper formatting
-        if len(data_reset) > 0:
-            first_price = float(data_reset['Close'].iloc[0])
-            last_price = float(data_reset['Close'].iloc[-1])
+        if close_np.size > 0:
+            first_price = float(close_np[0])
+            last_price = float(close_np[-1])
             price_change_val = last_price - first_price
             pct_change_val = (price_change_val / first_price) * 100 if first_price != 0 else 0
         else:
@@ -286,7 +528,7 @@ else:
         """, unsafe_allow_html=True)
     
     with col3:
-        avg_volume_val = float(data['Volume'].mean()) if 'Volume' in data.columns else 0
+        avg_volume_val = float(np.nanmean(vol_np)) if vol_np is not None else 0
         st.markdown(f"""
         <div class="metric-card">
             <div style="font-size: 0.9rem; opacity: 0.9;">Avg Volume</div>
@@ -303,70 +545,28 @@ else:
         </div>
         """, unsafe_allow_html=True)
 
-    # --- Make sure 'Close' is a clean Series ---
-    close_series = data['Close']
-    if isinstance(close_series, pd.DataFrame):
-        close_series = close_series.squeeze()   # ✅ Flatten to 1D if it's (n,1)
-    close_series = close_series.dropna().astype(float)
-
     # --- Multiplicative Decomposition ---
     st.markdown('<div class="section-header">🔍 Time Series Decomposition</div>', unsafe_allow_html=True)
     
     st.info("This section breaks down the stock price into trend, seasonality, and residual components using multiplicative decomposition.")
 
-    # ✅ Ensure all values are positive for multiplicative model
-    if len(close_series) > 0 and np.any(close_series.values <= 0):
-        close_series = close_series - close_series.min() + 1
-
     try:
         # Check if we have enough data for decomposition
         if len(close_series) < 60:  # Need at least 2 periods
             st.warning(f"⚠️ Not enough data for decomposition. Need at least 60 days, but got {len(close_series)} days.")
         else:
             with st.spinner('Performing time series decomposition...'):
-                result = seasonal_decompose(close_series, model='multiplicative', period=30)
-            
-            # Set matplotlib style to default
-            plt.style.use('default')
-            
-            # Apply theme to matplotlib plots
-            if theme == "Dark":
-                plt.rcParams.update({
-                    'figure.facecolor': '#1e1e1e',
-                    'axes.facecolor': '#1e1e1e',
-                    'axes.edgecolor': 'white',
-                    'axes.labelcolor': 'white',
-                    'text.color': 'white',
-                    'xtick.color': 'white',
-                    'ytick.color': 'white'
-                })
+                dates = close_series.index
+                if dates.tz is not None:
+                    dates = dates.tz_localize(None)
+                decomp_png = render_decomp_png(
+                    np.ascontiguousarray(close_series, dtype=np.float64).tobytes(),
+                    dates.values.astype('datetime64[ns]').view(np.int64).tobytes()
+                )
             
             # --- Plot decomposition ---
             st.markdown('<div class="plot-container">', unsafe_allow_html=True)
-            fig, axes = plt.subplots(4, 1, figsize=(12, 10))
-            
-            # Custom colors for each subplot
-            colors = ['#1f77b4', '#2ca02c', '#d62728', '#ff7f0e']
-            
-            result.observed.plot(ax=axes[0], title='Observed (Original Data)', color=colors[0], linewidth=2)
-            axes[0].grid(True, alpha=0.3)
-            
-            result.trend.plot(ax=axes[1], title='Trend', color=colors[1], linewidth=2)
-            axes[1].grid(True, alpha=0.3)
-            
-            result.seasonal.plot(ax=axes[2], title='Seasonality', color=colors[2], linewidth=2)
-            axes[2].grid(True, alpha=0.3)
-            
-            result.resid.plot(ax=axes[3], title='Residuals', color=colors[3], linewidth=2)
-            axes[3].grid(True, alpha=0.3)
-            
-            # Apply theme to subplot backgrounds
-            if theme == "Dark":
-                for ax in axes:
-                    ax.set_facecolor('#1e1e1e')
-            
-            plt.tight_layout()
-            st.pyplot(fig)
+            st.image(decomp_png)
             st.markdown('</div>', unsafe_allow_html=True)
         
     except Exception as e:
@@ -390,57 +590,49 @@ else:
     else:
         with st.spinner('Training SARIMA model... This may take a few moments.'):
             # Use SARIMA for prediction
-            forecast_values, confidence_intervals, sarima_model = fit_sarima_model(close_series, forecast_days=30)
+            forecast_values, confidence_intervals, sarima_model = fit_sarima_model(close_series, forecast_days=30, pending=sarima_pending)
             
             # Create future dates for prediction
             last_date = data_reset["Date"].iloc[-1]
-            future_dates = pd.date_range(last_date + timedelta(days=1), periods=30)
+            future_dates = pd.date_range(last_date + timedelta(days=1), periods=30, name="Date")
             
-            future_df = pd.DataFrame({
-                "Date": future_dates,
-                "Predicted Close": forecast_values.values,
-                "Lower CI": confidence_intervals.iloc[:, 0],
-                "Upper CI": confidence_intervals.iloc[:, 1]
-            })
+            # Fill one preallocated block from the raw arrays and wrap it once, indexed by date
+            forecast_bundle = np.empty((30, 3), dtype=np.float32)
+            forecast_bundle[:, 0] = forecast_values
+            forecast_bundle[:, 1:] = confidence_intervals
+            future_df = pd.DataFrame(forecast_bundle, columns=["Predicted Close", "Lower CI", "Upper CI"], index=future_dates, copy=False)
 
         # Plot actual + predicted
         st.markdown('<div class="plot-container">', unsafe_allow_html=True)
-        fig2, ax = plt.subplots(figsize=(12, 6))
-        
-        # Apply theme to matplotlib plot
-        if theme == "Dark":
-            plt.rcParams.update({
-                'figure.facecolor': '#1e1e1e',
-                'axes.facecolor': '#1e1e1e',
-                'axes.edgecolor': 'white',
-                'axes.labelcolor': 'white',
-                'text.color': 'white',
-                'xtick.color': 'white',
-                'ytick.color': 'white'
-            })
-            ax.set_facecolor('#1e1e1e')
+        fig2 = go.Figure()
         
         # Plot historical data
-        ax.plot(data_reset["Date"], data_reset["Close"], label="Historical Prices", color="#1f77b4", linewidth=3, alpha=0.8)
+        fig2.add_scatter(x=data_reset["Date"], y=close_np, name="Historical Prices",
+                         line=dict(color="#1f77b4", width=3), opacity=0.8)
         
         # Plot predictions
-        ax.plot(future_df["Date"], future_df["Predicted Close"], label="SARIMA Prediction", color="#ff7f0e", linewidth=3, linestyle='--')
-        
-        # Plot confidence intervals
-        ax.fill_between(future_df["Date"], 
-                       future_df["Lower CI"], 
-                       future_df["Upper CI"], 
-                       color="#ff7f0e", alpha=0.2, label="95% Confidence Interval")
+        fig2.add_scatter(x=future_df.index, y=future_df["Predicted Close"], name="SARIMA Prediction",
+                         line=dict(color="#ff7f0e", width=3, dash='dash'))
         
-        ax.legend(fontsize=12)
-        ax.set_title("Stock Price Prediction using SARIMA (Next 30 Days)", fontsize=16, fontweight='bold', pad=20)
-        ax.set_xlabel("Date", fontsize=12)
-        ax.set_ylabel("Price (₹)", fontsize=12)
-        ax.grid(True, alpha=0.3)
+        # Plot confidence intervals: upper edge first, then fill the lower edge up to it
+        fig2.add_scatter(x=future_df.index, y=future_df["Upper CI"], line=dict(width=0),
+                         showlegend=False, hoverinfo='skip')
+        fig2.add_scatter(x=future_df.index, y=future_df["Lower CI"], name="95% Confidence Interval",
+                         fill='tonexty', fillcolor='rgba(255, 127, 14, 0.2)', line=dict(width=0))
         
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        st.pyplot(fig2)
+        # Rendered client-side: the server only ships the figure spec
+        fig2.update_layout(
+            title=dict(text="<b>Stock Price Prediction using SARIMA (Next 30 Days)</b>", font=dict(size=20)),
+            xaxis_title="Date",
+            yaxis_title="Price (₹)",
+            paper_bgcolor='rgba(0, 0, 0, 0)',
+            plot_bgcolor='rgba(0, 0, 0, 0)',
+            font=dict(color=NEUTRAL_FG),
+            xaxis=dict(gridcolor='rgba(128, 128, 128, 0.3)'),
+            yaxis=dict(gridcolor='rgba(128, 128, 128, 0.3)'),
+            height=600
+        )
+        st.plotly_chart(fig2, theme=None)
         st.markdown('</div>', unsafe_allow_html=True)
 
         # Display prediction summary - Using regular Streamlit metrics
@@ -490,4 +682,19 @@ st.markdown(
     "Stock Analysis | Made with Love by Code Unity | For educational purposes only"
     "</div>", 
     unsafe_allow_html=True
-)
\ No newline at end of file
+)
+
+# --- Background Cache Warm-up ---
+@st.cache_resource
+def _warm_cache():
+    """
+    Prefetch the default date range for every listed company once per server,
+    so picking another company is a cache hit instead of a Yahoo Finance request
+    """
+    executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="prefetch")
+    for symbol in companies.values():
+        executor.submit(load_prices, symbol, DEFAULT_START_DATE, date.today())
+    executor.shutdown(wait=False)
+    return True
+
+_warm_cache()
\ No newline at end of file